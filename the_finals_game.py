@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import functools
-from typing import List
+from typing import List, Tuple
 
 from dataclasses import dataclass
 
@@ -13,6 +13,144 @@ from ..game_objective_template import GameObjectiveTemplate
 from ..enums import KeymastersKeepGamePlatforms
 
 
+# Data Pools
+BUILDS: Tuple[str, ...] = (
+    "Light",
+    "Medium",
+    "Heavy",
+)
+
+SPECIALIZATIONS_LIGHT: Tuple[str, ...] = (
+    "Cloaking Device",
+    "Grappling Hook",
+    "Evasive Dash",
+)
+
+WEAPONS_LIGHT: Tuple[str, ...] = (
+    "93R",
+    "M11",
+    "Recurve Bow",
+    "SR-84",
+    "Throwing Knives",
+    "ARN-220",
+    "Dagger",
+    "LH1",
+    "M26 Matter",
+    "SH1900",
+    "Sword",
+    "V95",
+    "XP-54",
+)
+
+GADGETS_LIGHT: Tuple[str, ...] = (
+    "Breach Charge",
+    "Flashbang",
+    "Frag Grenade",
+    "Goo Grenade",
+    "Pyro Grenade",
+    "Smoke Grenade",
+    "Sonar Grenade",
+    "Gas Grenade",
+    "Gateway",
+    "Glitch Grenade",
+    "Gravity Vortex",
+    "Nullifier",
+    "Thermal Bore",
+    "Thermal Vision",
+    "Tracking Dart",
+    "Vanishing Bomb",
+    "H+ Infuser",
+)
+
+SPECIALIZATIONS_MEDIUM: Tuple[str, ...] = (
+    "Guardian Turret",
+    "Healing Beam",
+    "Dematerializer",
+)
+
+WEAPONS_MEDIUM: Tuple[str, ...] = (
+    "AKM",
+    "CB-01 Repeater",
+    "FAMAS",
+    "PIKE-556",
+    "R .357",
+    "Cerberus 12GA",
+    "CL-40",
+    "Dual Blades",
+    "FCAR",
+    "Model 1887",
+    "Riot Shield",
+)
+
+GADGETS_MEDIUM: Tuple[str, ...] = (
+    "Defibrillator",
+    "Explosive Mine",
+    "Flashbang",
+    "Frag Grenade",
+    "Gas Mine",
+    "Glitch Trap",
+    "Goo Grenade",
+    "Jump Pad",
+    "Pyro Grenade",
+    "Smoke Grenade",
+    "APS Turret",
+    "Data Reshaper",
+    "Gas Grenade",
+    "Proximity Sensor",
+    "Zipline",
+    "Breach Drill",
+)
+
+SPECIALIZATIONS_HEAVY: Tuple[str, ...] = (
+    "Charge 'N' Slam",
+    "Winch Claw",
+    "Goo Gun",
+    "Mesh Shield",
+)
+
+WEAPONS_HEAVY: Tuple[str, ...] = (
+    "Flamethrower",
+    "Lewis Gun",
+    "M60",
+    "Sledgehammer",
+    ".50 Akimbo",
+    "KS-23",
+    "M134 Minigun",
+    "MGL32",
+    "SA1216",
+    "Shak-50",
+    "Spear",
+)
+
+GADGETS_HEAVY: Tuple[str, ...] = (
+    "Barricade",
+    "Explosive Mine",
+    "Flashbang",
+    "Frag Grenade",
+    "Goo Grenade",
+    "Pyro Grenade",
+    "RPG-7",
+    "Smoke Grenade",
+    "Anti-Gravity Cube",
+    "C4",
+    "Dome Shield",
+    "Gas Grenade",
+    "Lockbolt",
+    "Proximity Sensor",
+    "Pyro Mine",
+    "Healing Emitter",
+)
+
+ROUNDS: Tuple[str, ...] = (
+    "Two",
+    "Three",
+)
+
+ELIMINATIONS: range = range(10, 20)
+
+REVIVES: range = range(5, 10)
+
+
 @dataclass
 class FinalsArchipelagoOptions:
     finals_include_world_tour: FinalsIncludeWorldTour
@@ -47,13 +185,42 @@ class FinalsGame(Game):
         ]
 
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        templates: List[GameObjectiveTemplate] = list()
+        return list(self.objective_template_table(self.include_world_tour, self.include_specific_equipment))
+
+    @staticmethod
+    def clear_objective_template_cache() -> None:
+        FinalsGame.objective_template_table.cache_clear()
+        FinalsGame.base_objective_templates.cache_clear()
+        FinalsGame.specific_equipment_objective_templates.cache_clear()
+        FinalsGame.world_tour_objective_templates.cache_clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def objective_template_table(
+        include_world_tour: bool,
+        include_specific_equipment: bool,
+    ) -> Tuple[GameObjectiveTemplate, ...]:
+        # Shared by every FinalsGame with the same options; there are only four combinations.
+        # Each template group is cached on its own, so toggling one option reuses the other groups as-is
+        templates: List[GameObjectiveTemplate] = list(FinalsGame.base_objective_templates())
 
-        templates.extend([
+        if include_specific_equipment:
+            templates.extend(FinalsGame.specific_equipment_objective_templates())
+
+        if include_world_tour:
+            templates.extend(FinalsGame.world_tour_objective_templates())
+
+        return tuple(templates)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def base_objective_templates() -> Tuple[GameObjectiveTemplate, ...]:
+        # Depends on no options
+        return (
             GameObjectiveTemplate(
                 label="Win a Quickplay match with the BUILD build",
                 data={
-                    "BUILD": (self.builds, 1),
+                    "BUILD": (FinalsGame.builds, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -62,7 +229,7 @@ class FinalsGame(Game):
             GameObjectiveTemplate(
                 label="Win a game of Team Deathmatch with the BUILD build",
                 data={
-                    "BUILD": (self.builds, 1),
+                    "BUILD": (FinalsGame.builds, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -71,7 +238,7 @@ class FinalsGame(Game):
             GameObjectiveTemplate(
                 label="Win a Quick Cash match with the BUILD build",
                 data={
-                    "BUILD": (self.builds, 1),
+                    "BUILD": (FinalsGame.builds, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -80,7 +247,7 @@ class FinalsGame(Game):
             GameObjectiveTemplate(
                 label="Get an elimination or revive with a BUILD build gadget",
                 data={
-                    "BUILD": (self.builds, 1),
+                    "BUILD": (FinalsGame.builds, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -89,8 +256,8 @@ class FinalsGame(Game):
             GameObjectiveTemplate(
                 label="Get ELIMINATIONS eliminations with BUILD build",
                 data={
-                    "BUILD": (self.builds, 1),
-                    "ELIMINATIONS": (self.eliminations_range, 1),
+                    "BUILD": (FinalsGame.builds, 1),
+                    "ELIMINATIONS": (FinalsGame.eliminations_range, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -99,7 +266,7 @@ class FinalsGame(Game):
             GameObjectiveTemplate(
                 label="Revive teammates REVIVES times",
                 data={
-                    "REVIVES": (self.revives_range, 1),
+                    "REVIVES": (FinalsGame.revives_range, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -140,131 +307,107 @@ class FinalsGame(Game):
                 is_difficult=False,
                 weight=1,
             ),
-        ])
-
-        if self.include_specific_equipment:
-            templates.append(
-                GameObjectiveTemplate(
-                    label="Win a Quickplay match using SPECIALIZATIONLIGHT, WEAPONLIGHT, GADGETLIGHT on the Light build",
-                    data={
-                        "SPECIALIZATIONLIGHT": (self.specializationslight, 1),
-                        "WEAPONLIGHT": (self.weaponslight, 1),
-                        "GADGETLIGHT": (self.gadgetslight, 3),
-                    },
-                    is_time_consuming=False,
-                    is_difficult=False,
-                    weight=1,
-                ),
-            )
-
-        if self.include_specific_equipment:
-            templates.append(
-                GameObjectiveTemplate(
-                    label="Win a Quickplay match using SPECIALIZATIONMEDIUM, WEAPONMEDIUM, GADGETMEDIUM on the Medium build",
-                    data={
-                        "SPECIALIZATIONMEDIUM": (self.specializationsmedium, 1),
-                        "WEAPONMEDIUM": (self.weaponsmedium, 1),
-                        "GADGETMEDIUM": (self.gadgetsmedium, 3),
-                    },
-                    is_time_consuming=False,
-                    is_difficult=False,
-                    weight=1,
-                ),
-            )
-
-        if self.include_specific_equipment:
-            templates.append(
-                GameObjectiveTemplate(
-                    label="Win a Quickplay match using SPECIALIZATIONHEAVY, WEAPONHEAVY, GADGETHEAVY on the Heavy build",
-                    data={
-                        "SPECIALIZATIONHEAVY": (self.specializationsheavy, 1),
-                        "WEAPONHEAVY": (self.weaponsheavy, 1),
-                        "GADGETHEAVY": (self.gadgetsheavy, 3),
-                    },
-                    is_time_consuming=False,
-                    is_difficult=False,
-                    weight=1,
-                ),
-            )
-
-        if self.include_specific_equipment:
-            templates.append(
-                GameObjectiveTemplate(
-                    label="Get ELIMINATIONS eliminations with the WEAPONLIGHT Light weapon",
-                    data={
-                        "WEAPONLIGHT": (self.weaponslight, 1),
-                        "ELIMINATIONS": (self.eliminations_range, 1),
-                    },
-                    is_time_consuming=False,
-                    is_difficult=False,
-                    weight=1,
-                ),
-            )
-
-        if self.include_specific_equipment:
-            templates.append(
-                GameObjectiveTemplate(
-                    label="Get ELIMINATIONS eliminations with the WEAPONMEDIUM Medium weapon",
-                    data={
-                        "WEAPONMEDIUM": (self.weaponsmedium, 1),
-                        "ELIMINATIONS": (self.eliminations_range, 1),
-                    },
-                    is_time_consuming=False,
-                    is_difficult=False,
-                    weight=1,
-                ),
-            )
-
-        if self.include_specific_equipment:
-            templates.append(
-                GameObjectiveTemplate(
-                    label="Get ELIMINATIONS eliminations with the WEAPONHEAVY Heavy weapon",
-                    data={
-                        "WEAPONHEAVY": (self.weaponsheavy, 1),
-                        "ELIMINATIONS": (self.eliminations_range, 1),
-                    },
-                    is_time_consuming=False,
-                    is_difficult=False,
-                    weight=1,
-                ),
-            )
-
-        if self.include_world_tour:
-            templates.append(
-                GameObjectiveTemplate(
-                    label="Win a World Tour",
-                    data=dict(),
-                    is_time_consuming=False,
-                    is_difficult=True,
-                    weight=3,
-                ),
-            )
-
-        if self.include_world_tour:
-            templates.append(
-                GameObjectiveTemplate(
-                    label="Reach Round ROUND in World Tour",
-                    data={
-                        "ROUND": (self.rounds, 1),
-                    },
-                    is_time_consuming=False,
-                    is_difficult=False,
-                    weight=1,
-                ),
-            )
-            
-        if self.include_world_tour:
-            templates.append(
-                GameObjectiveTemplate(
-                    label="Reach 30000 Cash in a single round",
-                    data=dict(),
-                    is_time_consuming=False,
-                    is_difficult=True,
-                    weight=1,
-                )
-            )
-
-        return templates
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def specific_equipment_objective_templates() -> Tuple[GameObjectiveTemplate, ...]:
+        # Depends on finals_include_specific_equipment
+        return (
+            GameObjectiveTemplate(
+                label="Win a Quickplay match using SPECIALIZATIONLIGHT, WEAPONLIGHT, GADGETLIGHT on the Light build",
+                data={
+                    "SPECIALIZATIONLIGHT": (FinalsGame.specializationslight, 1),
+                    "WEAPONLIGHT": (FinalsGame.weaponslight, 1),
+                    "GADGETLIGHT": (FinalsGame.gadgetslight, 3),
+                },
+                is_time_consuming=False,
+                is_difficult=False,
+                weight=1,
+            ),
+            GameObjectiveTemplate(
+                label="Win a Quickplay match using SPECIALIZATIONMEDIUM, WEAPONMEDIUM, GADGETMEDIUM on the Medium build",
+                data={
+                    "SPECIALIZATIONMEDIUM": (FinalsGame.specializationsmedium, 1),
+                    "WEAPONMEDIUM": (FinalsGame.weaponsmedium, 1),
+                    "GADGETMEDIUM": (FinalsGame.gadgetsmedium, 3),
+                },
+                is_time_consuming=False,
+                is_difficult=False,
+                weight=1,
+            ),
+            GameObjectiveTemplate(
+                label="Win a Quickplay match using SPECIALIZATIONHEAVY, WEAPONHEAVY, GADGETHEAVY on the Heavy build",
+                data={
+                    "SPECIALIZATIONHEAVY": (FinalsGame.specializationsheavy, 1),
+                    "WEAPONHEAVY": (FinalsGame.weaponsheavy, 1),
+                    "GADGETHEAVY": (FinalsGame.gadgetsheavy, 3),
+                },
+                is_time_consuming=False,
+                is_difficult=False,
+                weight=1,
+            ),
+            GameObjectiveTemplate(
+                label="Get ELIMINATIONS eliminations with the WEAPONLIGHT Light weapon",
+                data={
+                    "WEAPONLIGHT": (FinalsGame.weaponslight, 1),
+                    "ELIMINATIONS": (FinalsGame.eliminations_range, 1),
+                },
+                is_time_consuming=False,
+                is_difficult=False,
+                weight=1,
+            ),
+            GameObjectiveTemplate(
+                label="Get ELIMINATIONS eliminations with the WEAPONMEDIUM Medium weapon",
+                data={
+                    "WEAPONMEDIUM": (FinalsGame.weaponsmedium, 1),
+                    "ELIMINATIONS": (FinalsGame.eliminations_range, 1),
+                },
+                is_time_consuming=False,
+                is_difficult=False,
+                weight=1,
+            ),
+            GameObjectiveTemplate(
+                label="Get ELIMINATIONS eliminations with the WEAPONHEAVY Heavy weapon",
+                data={
+                    "WEAPONHEAVY": (FinalsGame.weaponsheavy, 1),
+                    "ELIMINATIONS": (FinalsGame.eliminations_range, 1),
+                },
+                is_time_consuming=False,
+                is_difficult=False,
+                weight=1,
+            ),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def world_tour_objective_templates() -> Tuple[GameObjectiveTemplate, ...]:
+        # Depends on finals_include_world_tour
+        return (
+            GameObjectiveTemplate(
+                label="Win a World Tour",
+                data=dict(),
+                is_time_consuming=False,
+                is_difficult=True,
+                weight=3,
+            ),
+            GameObjectiveTemplate(
+                label="Reach Round ROUND in World Tour",
+                data={
+                    "ROUND": (FinalsGame.rounds, 1),
+                },
+                is_time_consuming=False,
+                is_difficult=False,
+                weight=1,
+            ),
+            GameObjectiveTemplate(
+                label="Reach 30000 Cash in a single round",
+                data=dict(),
+                is_time_consuming=False,
+                is_difficult=True,
+                weight=1,
+            ),
+        )
 
     @property
     def include_world_tour(self) -> bool:
@@ -275,166 +418,56 @@ class FinalsGame(Game):
         return bool(self.archipelago_options.finals_include_specific_equipment.value)
 
     @staticmethod
-    def builds() -> List[str]:
-        return [
-            "Light",
-            "Medium",
-            "Heavy",
-        ]
+    def builds() -> Tuple[str, ...]:
+        return BUILDS
 
     @staticmethod
-    def specializationslight() -> List[str]:
-        return [
-            "Cloaking Device",
-            "Grappling Hook",
-            "Evasive Dash",
-        ]
+    def specializationslight() -> Tuple[str, ...]:
+        return SPECIALIZATIONS_LIGHT
 
     @staticmethod
-    def weaponslight() -> List[str]:
-        return [
-            "93R",
-            "M11",
-            "Recurve Bow",
-            "SR-84",
-            "Throwing Knives",
-            "ARN-220",
-            "Dagger",
-            "LH1",
-            "M26 Matter",
-            "SH1900",
-            "Sword",
-            "V95",
-            "XP-54",
-        ]
+    def weaponslight() -> Tuple[str, ...]:
+        return WEAPONS_LIGHT
 
     @staticmethod
-    def gadgetslight() -> List[str]:
-        return [
-            "Breach Charge",
-            "Flashbang",
-            "Frag Grenade",
-            "Goo Grenade",
-            "Pyro Grenade",
-            "Smoke Grenade",
-            "Sonar Grenade",
-            "Gas Grenade",
-            "Gateway",
-            "Glitch Grenade",
-            "Gravity Vortex",
-            "Nullifier",
-            "Thermal Bore",
-            "Thermal Vision",
-            "Tracking Dart",
-            "Vanishing Bomb",
-            "H+ Infuser",
-        ]
+    def gadgetslight() -> Tuple[str, ...]:
+        return GADGETS_LIGHT
 
     @staticmethod
-    def specializationsmedium() -> List[str]:
-        return [
-            "Guardian Turret",
-            "Healing Beam",
-            "Dematerializer",
-        ]
+    def specializationsmedium() -> Tuple[str, ...]:
+        return SPECIALIZATIONS_MEDIUM
 
     @staticmethod
-    def weaponsmedium() -> List[str]:
-        return [
-            "AKM",
-            "CB-01 Repeater",
-            "FAMAS",
-            "PIKE-556",
-            "R .357",
-            "Cerberus 12GA",
-            "CL-40",
-            "Dual Blades",
-            "FCAR",
-            "Model 1887",
-            "Riot Shield",
-        ]
+    def weaponsmedium() -> Tuple[str, ...]:
+        return WEAPONS_MEDIUM
 
     @staticmethod
-    def gadgetsmedium() -> List[str]:
-        return [
-            "Defibrillator",
-            "Explosive Mine",
-            "Flashbang",
-            "Frag Grenade",
-            "Gas Mine",
-            "Glitch Trap",
-            "Goo Grenade",
-            "Jump Pad",
-            "Pyro Grenade",
-            "Smoke Grenade",
-            "APS Turret",
-            "Data Reshaper",
-            "Gas Grenade",
-            "Proximity Sensor",
-            "Zipline",
-            "Breach Drill",
-        ]
+    def gadgetsmedium() -> Tuple[str, ...]:
+        return GADGETS_MEDIUM
 
     @staticmethod
-    def specializationsheavy() -> List[str]:
-        return [
-            "Charge 'N' Slam",
-            "Winch Claw",
-            "Goo Gun",
-            "Mesh Shield",
-        ]
+    def specializationsheavy() -> Tuple[str, ...]:
+        return SPECIALIZATIONS_HEAVY
 
     @staticmethod
-    def weaponsheavy() -> List[str]:
-        return [
-            "Flamethrower",
-            "Lewis Gun",
-            "M60",
-            "Sledgehammer",
-            ".50 Akimbo",
-            "KS-23",
-            "M134 Minigun",
-            "MGL32",
-            "SA1216",
-            "Shak-50",
-            "Spear",
-        ]
+    def weaponsheavy() -> Tuple[str, ...]:
+        return WEAPONS_HEAVY
 
     @staticmethod
-    def gadgetsheavy() -> List[str]:
-        return [
-            "Barricade",
-            "Explosive Mine",
-            "Flashbang",
-            "Frag Grenade",
-            "Goo Grenade",
-            "Pyro Grenade",
-            "RPG-7",
-            "Smoke Grenade",
-            "Anti-Gravity Cube",
-            "C4",
-            "Dome Shield",
-            "Gas Grenade",
-            "Lockbolt",
-            "Proximity Sensor",
-            "Pyro Mine",
-            "Healing Emitter",
-        ]
+    def gadgetsheavy() -> Tuple[str, ...]:
+        return GADGETS_HEAVY
 
     @staticmethod
-    def rounds() -> List[str]:
-        return [
-            "Two",
-            "Three",
-        ]
+    def rounds() -> Tuple[str, ...]:
+        return ROUNDS
 
     @staticmethod
     def eliminations_range() -> range:
-        return range(10, 20)
+        return ELIMINATIONS
 
     @staticmethod
     def revives_range() -> range:
-        return range(5, 10)
+        return REVIVES
 
 # Archipelago Options
 class FinalsIncludeWorldTour(Toggle):
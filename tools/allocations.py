@@ -0,0 +1,163 @@
+"""
+Allocation budgets for the rolling hot path, measured with tracemalloc.
+
+Rolls a fixed number of objectives per game and option combination and reports, per roll:
+
+- pool_bytes / pool_blocks: memory the data callables allocate for the pools a roll looks up
+- peak_bytes: the most memory in use at once while rendering an objective, over what was in use before
+- retained_bytes / retained_blocks: what is still allocated once a roll returns, rendered label included
+
+Exits with status 1 when a game's pool_bytes goes over its budget. Data callables hand out shared,
+prebuilt pools, so their budget is zero; a per-call list copy sneaking back in fails as loudly as a
+slowdown would.
+
+    python tools/allocations.py --rolls 2000 --budget "The Finals=0"
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tracemalloc
+
+from random import Random
+from typing import Any, Dict, List, Optional, Type
+
+import keep_shims
+
+
+# Pool bytes per roll
+DEFAULT_BUDGETS: Dict[str, int] = {
+    "The Finals": 0,
+    "Unidentified Falling Objects": 0,
+}
+
+
+def retained(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> List[tracemalloc.StatisticDiff]:
+    filters: List[tracemalloc.Filter] = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    return after.filter_traces(filters).compare_to(before.filter_traces(filters), "filename")
+
+
+def measure(game_cls: Type[keep_shims.Game], options: Any, rolls: int, seed: int) -> Dict[str, float]:
+    game: keep_shims.Game = game_cls(Random(seed), options)
+
+    templates: List[Any] = game.game_objective_templates()
+    weights: List[int] = [template.weight for template in templates]
+
+    selected: List[Any] = game.random.choices(templates, weights=weights, k=rolls)
+
+    # Warm caches outside the measurement
+    game.generate_objectives(rolls)
+
+    # Every pool a roll looks up is kept alive, so anything a data callable allocates shows up as retained
+    pools: List[Optional[Any]] = [None] * sum(len(template.data) for template in selected)
+    objectives: List[Optional[str]] = [None] * rolls
+
+    peak_bytes: int = 0
+
+    tracemalloc.start()
+
+    try:
+        before: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+
+        index: int = 0
+
+        for template in selected:
+            for collection_callable, _ in template.data.values():
+                pools[index] = collection_callable()
+                index += 1
+
+        # The loop counter is an int object of its own once it passes the small-int cache
+        del index
+
+        after_pools: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+
+        for index, template in enumerate(selected):
+            current_bytes: int = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+            objectives[index] = template.generate_game_objective(game.random)
+
+            peak_bytes += tracemalloc.get_traced_memory()[1] - current_bytes
+
+        after_objectives: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    pool_statistics: List[tracemalloc.StatisticDiff] = retained(before, after_pools)
+    objective_statistics: List[tracemalloc.StatisticDiff] = retained(after_pools, after_objectives)
+
+    return {
+        "pool_bytes": sum(statistic.size_diff for statistic in pool_statistics) / rolls,
+        "pool_blocks": sum(statistic.count_diff for statistic in pool_statistics) / rolls,
+        "peak_bytes": peak_bytes / rolls,
+        "retained_bytes": sum(statistic.size_diff for statistic in objective_statistics) / rolls,
+        "retained_blocks": sum(statistic.count_diff for statistic in objective_statistics) / rolls,
+    }
+
+
+def run(rolls: int, seed: int, budgets: Dict[str, int]) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = list()
+
+    for game_cls in keep_shims.game_classes():
+        for option_values, options in keep_shims.option_combinations(game_cls):
+            result: Dict[str, float] = measure(game_cls, options, rolls, seed)
+            budget: int = budgets.get(game_cls.name, 0)
+
+            results.append({
+                "game": game_cls.name,
+                "options": option_values,
+                **result,
+                "budget_pool_bytes": budget,
+                "within_budget": result["pool_bytes"] <= budget,
+            })
+
+    return {
+        "rolls": rolls,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def parse_budget(value: str) -> Dict[str, int]:
+    name, _, budget = value.rpartition("=")
+
+    if not name:
+        raise argparse.ArgumentTypeError(f"expected GAME=BYTES, got {value!r}")
+
+    return {name: int(budget)}
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+
+    parser.add_argument("--rolls", type=int, default=2_000, help="objectives rolled per option combination")
+    parser.add_argument("--seed", type=int, default=0, help="seed for objective rolling (default: 0)")
+
+    parser.add_argument(
+        "--budget",
+        type=parse_budget,
+        action="append",
+        default=list(),
+        help="pool bytes per roll for a game, as GAME=BYTES (repeatable)",
+    )
+
+    arguments: argparse.Namespace = parser.parse_args()
+
+    budgets: Dict[str, int] = dict(DEFAULT_BUDGETS)
+
+    for budget in arguments.budget:
+        budgets.update(budget)
+
+    report: Dict[str, Any] = run(arguments.rolls, arguments.seed, budgets)
+
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+    if not all(result["within_budget"] for result in report["results"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmarks template construction, pool resolution and objective rolling for every game in this repository,
+under every option combination, and writes the results as JSON.
+
+Runs against the stand-ins in keep_shims, so no Archipelago checkout is needed:
+
+    python tools/benchmark.py --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import platform
+import statistics
+import sys
+import timeit
+
+from random import Random
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Type
+
+import keep_shims
+
+
+DEFAULT_COUNTS: Tuple[int, ...] = (1, 1_000, 100_000)
+
+
+def measure(function: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    timer: timeit.Timer = timeit.Timer(function)
+    loops: int = timer.autorange()[0]
+    timings: List[float] = [total / loops for total in timer.repeat(repeat=repeat, number=loops)]
+
+    return {
+        "loops": loops,
+        "best_seconds": min(timings),
+        "mean_seconds": statistics.fmean(timings),
+    }
+
+
+def callable_name(collection_callable: Callable[[], Any]) -> str:
+    if isinstance(collection_callable, functools.partial):
+        return f"{collection_callable.func.__name__}{collection_callable.args}"
+
+    return collection_callable.__name__
+
+
+def data_callables(game: keep_shims.Game) -> Dict[str, Callable[[], Any]]:
+    collection_callables: Dict[str, Callable[[], Any]] = dict()
+
+    for template in game.game_objective_templates():
+        for collection_callable, _ in template.data.values():
+            collection_callables.setdefault(callable_name(collection_callable), collection_callable)
+
+    return collection_callables
+
+
+def benchmarks(
+    game_cls: Type[keep_shims.Game],
+    counts: Tuple[int, ...],
+    seed: int,
+) -> Iterator[Tuple[str, str, int, Callable[[], Any], Dict[str, bool]]]:
+    for option_values, options in keep_shims.option_combinations(game_cls):
+        game: keep_shims.Game = game_cls(Random(seed), options)
+
+        def templates_cold(game: keep_shims.Game = game) -> None:
+            game.clear_objective_template_cache()
+            game.game_objective_templates()
+
+        yield "templates_cold", "game_objective_templates", 1, templates_cold, option_values
+        yield "templates_warm", "game_objective_templates", 1, game.game_objective_templates, option_values
+
+        for name, collection_callable in data_callables(game).items():
+            yield "pool", name, 1, collection_callable, option_values
+
+        for count in counts:
+            def roll(count: int = count, options: Any = options) -> None:
+                game_cls(Random(seed), options).generate_objectives(count)
+
+            yield "roll", "generate_objectives", count, roll, option_values
+
+
+def run(counts: Tuple[int, ...], repeat: int, seed: int) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = list()
+
+    for game_cls in keep_shims.game_classes():
+        for benchmark, target, count, function, option_values in benchmarks(game_cls, counts, seed):
+            results.append({
+                "game": game_cls.name,
+                "options": option_values,
+                "benchmark": benchmark,
+                "target": target,
+                "count": count,
+                **measure(function, repeat),
+            })
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions per benchmark (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for objective rolling (default: 0)")
+
+    parser.add_argument(
+        "--counts",
+        type=lambda value: tuple(int(count) for count in value.split(",")),
+        default=DEFAULT_COUNTS,
+        help="comma-separated objective counts to roll (default: 1,1000,100000)",
+    )
+
+    arguments: argparse.Namespace = parser.parse_args()
+    report: str = json.dumps(run(arguments.counts, arguments.repeat, arguments.seed), indent=2)
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output:
+            output.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
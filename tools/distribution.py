@@ -0,0 +1,127 @@
+"""
+Computes exact objective probabilities for every game and option combination from the template weights
+and pool sizes, without rolling anything.
+
+A template is drawn with probability weight / total weight among the templates that survive the difficulty
+and time-consuming filters. A placeholder sampling k of n pool values then shows each value with
+probability k / n.
+
+    python tools/distribution.py --exclude-difficult
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from fractions import Fraction
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+import keep_shims
+
+
+def template_probabilities(templates: Sequence[Any]) -> List[Tuple[Any, Fraction]]:
+    total_weight: int = sum(template.weight for template in templates)
+
+    return [(template, Fraction(template.weight, total_weight)) for template in templates]
+
+
+def placeholder_probabilities(templates: Sequence[Any]) -> Dict[str, Dict[str, Fraction]]:
+    """Probability that each value appears for each placeholder in a single rolled objective."""
+    probabilities: Dict[str, Dict[str, Fraction]] = dict()
+
+    for template, template_probability in template_probabilities(templates):
+        for key, (collection_callable, sample_count) in template.data.items():
+            if callable(sample_count):
+                sample_count = sample_count()
+
+            collection: Sequence[Any] = collection_callable()
+            value_probability: Fraction = template_probability * Fraction(sample_count, len(collection))
+
+            values: Dict[str, Fraction] = probabilities.setdefault(key, dict())
+
+            for value in collection:
+                values[str(value)] = values.get(str(value), Fraction(0)) + value_probability
+
+    return probabilities
+
+
+def report_entry(probability: Fraction) -> Dict[str, Any]:
+    return {
+        "probability": float(probability),
+        "exact": str(probability),
+    }
+
+
+def distribution(
+    game_cls: Type[keep_shims.Game],
+    include_difficult: bool,
+    include_time_consuming: bool,
+) -> List[Dict[str, Any]]:
+    combinations: List[Dict[str, Any]] = list()
+
+    for option_values, options in keep_shims.option_combinations(game_cls):
+        templates: List[Any] = [
+            template for template in game_cls(None, options).game_objective_templates()
+            if (include_difficult or not template.is_difficult)
+            and (include_time_consuming or not template.is_time_consuming)
+        ]
+
+        combinations.append({
+            "game": game_cls.name,
+            "options": option_values,
+            "templates": [
+                {"label": template.label, "weight": template.weight, **report_entry(probability)}
+                for template, probability in template_probabilities(templates)
+            ],
+            "placeholders": {
+                key: {value: report_entry(probability) for value, probability in values.items()}
+                for key, values in placeholder_probabilities(templates).items()
+            },
+        })
+
+    return combinations
+
+
+def format_table(combination: Dict[str, Any]) -> str:
+    options: str = ", ".join(f"{name}={value}" for name, value in combination["options"].items())
+    lines: List[str] = [f"{combination['game']} ({options})", ""]
+
+    for template in combination["templates"]:
+        lines.append(f"  {template['probability']:8.4%}  {template['exact']:>7}  w={template['weight']}  {template['label']}")
+
+    for key, values in combination["placeholders"].items():
+        lines.append("")
+        lines.append(f"  {key}")
+
+        for value, entry in values.items():
+            lines.append(f"    {entry['probability']:8.4%}  {entry['exact']:>9}  {value}")
+
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+
+    parser.add_argument("--exclude-difficult", action="store_true", help="drop templates marked is_difficult")
+    parser.add_argument("--exclude-time-consuming", action="store_true", help="drop templates marked is_time_consuming")
+    parser.add_argument("--json", action="store_true", help="emit JSON instead of text tables")
+
+    arguments: argparse.Namespace = parser.parse_args()
+
+    combinations: List[Dict[str, Any]] = [
+        combination
+        for game_cls in keep_shims.game_classes()
+        for combination in distribution(game_cls, not arguments.exclude_difficult, not arguments.exclude_time_consuming)
+    ]
+
+    if arguments.json:
+        json.dump(combinations, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write("\n\n".join(format_table(combination) for combination in combinations) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Opt-in call counting and timing for the game modules.
+
+Enabling an Instrumentation swaps timed wrappers in for each game's data callables,
+game_objective_templates and GameObjectiveTemplate.generate_game_objective, and disabling it puts the
+originals back. The game modules are never modified, so nothing is paid while instrumentation is off.
+
+    python tools/instrumentation.py --count 10000 --output profile.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import sys
+import time
+
+from random import Random
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Type
+
+import keep_shims
+
+
+# Class attributes that manage the template caches rather than produce game data
+EXCLUDED_ATTRIBUTES: Tuple[str, ...] = (
+    "clear_objective_template_cache",
+)
+
+
+class Instrumentation:
+    def __init__(self, game_classes: Iterable[Type[keep_shims.Game]], template_cls: Type) -> None:
+        self.game_classes: List[Type[keep_shims.Game]] = list(game_classes)
+        self.template_cls: Type = template_cls
+
+        self.calls: Dict[str, int] = dict()
+        self.seconds: Dict[str, float] = dict()
+
+        self.originals: List[Tuple[Type, str, Any]] = list()
+
+    def __enter__(self) -> Instrumentation:
+        self.enable()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.originals)
+
+    def timed(self, key: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        self.calls.setdefault(key, 0)
+        self.seconds.setdefault(key, 0.0)
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start: float = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.seconds[key] += time.perf_counter() - start
+                self.calls[key] += 1
+
+        return wrapper
+
+    def swap(self, owner: Type, name: str) -> None:
+        original: Any = vars(owner)[name]
+        key: str = f"{owner.__name__}.{name}"
+
+        if isinstance(original, staticmethod):
+            replacement: Any = staticmethod(self.timed(key, original.__func__))
+        else:
+            replacement = self.timed(key, original)
+
+        self.originals.append((owner, name, original))
+        setattr(owner, name, replacement)
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+
+        for game_cls in self.game_classes:
+            self.swap(game_cls, "game_objective_templates")
+
+            for name, value in list(vars(game_cls).items()):
+                if not isinstance(value, staticmethod) or name in EXCLUDED_ATTRIBUTES:
+                    continue
+
+                # Cached template builders keep their lru_cache wrapper so the caches can still be cleared
+                if not hasattr(value.__func__, "cache_clear"):
+                    self.swap(game_cls, name)
+
+        self.swap(self.template_cls, "generate_game_objective")
+        self.clear_template_caches()
+
+    def disable(self) -> None:
+        for owner, name, original in reversed(self.originals):
+            setattr(owner, name, original)
+
+        self.originals.clear()
+        self.clear_template_caches()
+
+    def clear_template_caches(self) -> None:
+        # Cached templates hold references to whichever data callables were installed when they were built
+        for game_cls in self.game_classes:
+            game_cls.clear_objective_template_cache()
+
+    def reset(self) -> None:
+        for key in self.calls:
+            self.calls[key] = 0
+            self.seconds[key] = 0.0
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {
+            key: {
+                "calls": self.calls[key],
+                "seconds": self.seconds[key],
+            }
+            for key in sorted(self.calls)
+        }
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(self.snapshot(), output, indent=2)
+            output.write("\n")
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+
+    parser.add_argument("--count", type=int, default=1_000, help="objectives to roll per option combination")
+    parser.add_argument("--seed", type=int, default=0, help="seed for objective rolling (default: 0)")
+    parser.add_argument("--output", help="write the profile here instead of stdout")
+
+    arguments: argparse.Namespace = parser.parse_args()
+
+    game_classes: List[Type[keep_shims.Game]] = list(keep_shims.game_classes())
+
+    with Instrumentation(game_classes, keep_shims.GameObjectiveTemplate) as instrumentation:
+        for game_cls in game_classes:
+            for _, options in keep_shims.option_combinations(game_cls):
+                game_cls(Random(arguments.seed), options).generate_objectives(arguments.count)
+
+    if arguments.output:
+        instrumentation.write(arguments.output)
+    else:
+        json.dump(instrumentation.snapshot(), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
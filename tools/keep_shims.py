@@ -0,0 +1,165 @@
+"""
+Stand-in Keymaster's Keep modules so the game modules in this repository can be imported and rolled
+outside a full Archipelago checkout.
+
+The stand-ins mirror the parts of the Keep core the games touch: Options.Toggle, Game,
+GameObjectiveTemplate and KeymastersKeepGamePlatforms. Rolling follows the core's scheme of one
+weighted template draw followed by a random.sample per placeholder.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import importlib.util
+import itertools
+import sys
+import types
+
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+
+REPOSITORY_ROOT: Path = Path(__file__).resolve().parent.parent
+
+PACKAGE_NAME: str = "keymasters_keep"
+
+GAME_MODULES: Tuple[str, ...] = (
+    "the_finals_game",
+    "unidentified_falling_objects_game",
+)
+
+
+class Toggle:
+    default: int = 0
+
+    def __init__(self, value: Optional[int] = None) -> None:
+        self.value: int = self.default if value is None else int(value)
+
+
+class KeymastersKeepGamePlatforms(enum.Enum):
+    PC = "PC"
+    PS4 = "PS4"
+    PS5 = "PS5"
+    SW = "SW"
+    XONE = "XONE"
+    XSX = "XSX"
+
+
+@dataclasses.dataclass
+class GameObjectiveTemplate:
+    label: str
+    data: Dict[str, Tuple[Callable[[], Any], Union[int, Callable[[], int]]]]
+    is_time_consuming: bool = False
+    is_difficult: bool = False
+    weight: int = 1
+
+    def generate_game_objective(self, rng: Random) -> str:
+        label: str = self.label
+
+        for key, (collection_callable, sample_count) in self.data.items():
+            if callable(sample_count):
+                sample_count = sample_count()
+
+            sample: List[Any] = rng.sample(collection_callable(), sample_count)
+            label = label.replace(key, ", ".join(str(item) for item in sample))
+
+        return label
+
+
+class Game:
+    name: str
+    options_cls: Optional[Type] = None
+
+    def __init__(self, random: Optional[Random] = None, archipelago_options: Any = None) -> None:
+        self.random: Random = random or Random()
+        self.archipelago_options: Any = archipelago_options
+
+    def optional_game_constraint_templates(self) -> List[GameObjectiveTemplate]:
+        return list()
+
+    def game_objective_templates(self) -> List[GameObjectiveTemplate]:
+        return list()
+
+    def generate_objectives(
+        self,
+        count: int = 1,
+        include_difficult: bool = True,
+        include_time_consuming: bool = True,
+    ) -> List[str]:
+        templates: List[GameObjectiveTemplate] = [
+            template for template in self.game_objective_templates()
+            if (include_difficult or not template.is_difficult)
+            and (include_time_consuming or not template.is_time_consuming)
+        ]
+
+        selected: List[GameObjectiveTemplate] = self.random.choices(
+            templates,
+            weights=[template.weight for template in templates],
+            k=count,
+        )
+
+        return [template.generate_game_objective(self.random) for template in selected]
+
+
+def install() -> None:
+    """Registers the stand-in modules in sys.modules. Safe to call more than once."""
+    if PACKAGE_NAME in sys.modules:
+        return
+
+    def module(name: str, **attributes: Any) -> types.ModuleType:
+        new_module: types.ModuleType = types.ModuleType(name)
+        new_module.__dict__.update(attributes)
+        sys.modules[name] = new_module
+
+        return new_module
+
+    module("Options", Toggle=Toggle)
+
+    module(PACKAGE_NAME, __path__=[])
+    module(f"{PACKAGE_NAME}.games", __path__=[str(REPOSITORY_ROOT)])
+    module(f"{PACKAGE_NAME}.enums", KeymastersKeepGamePlatforms=KeymastersKeepGamePlatforms)
+    module(f"{PACKAGE_NAME}.game", Game=Game)
+    module(f"{PACKAGE_NAME}.game_objective_template", GameObjectiveTemplate=GameObjectiveTemplate)
+
+
+def load_game_module(module_name: str) -> types.ModuleType:
+    """Imports one of the repository's game modules as if it lived in the Keep games package."""
+    install()
+
+    qualified_name: str = f"{PACKAGE_NAME}.games.{module_name}"
+
+    if qualified_name in sys.modules:
+        return sys.modules[qualified_name]
+
+    spec = importlib.util.spec_from_file_location(qualified_name, REPOSITORY_ROOT / f"{module_name}.py")
+    game_module: types.ModuleType = importlib.util.module_from_spec(spec)
+
+    sys.modules[qualified_name] = game_module
+    spec.loader.exec_module(game_module)
+
+    return game_module
+
+
+def game_classes() -> Iterator[Type[Game]]:
+    """Yields the Game subclass defined by each repository game module."""
+    for module_name in GAME_MODULES:
+        game_module: types.ModuleType = load_game_module(module_name)
+
+        for value in vars(game_module).values():
+            if isinstance(value, type) and issubclass(value, Game) and value.__module__ == game_module.__name__:
+                yield value
+
+
+def option_combinations(game_cls: Type[Game]) -> Iterator[Tuple[Dict[str, bool], Any]]:
+    """Yields (option values, options instance) for every combination of the game's toggles."""
+    game_module: types.ModuleType = sys.modules[game_cls.__module__]
+    fields: Tuple[dataclasses.Field, ...] = dataclasses.fields(game_cls.options_cls)
+
+    for values in itertools.product((False, True), repeat=len(fields)):
+        options: Any = game_cls.options_cls(**{
+            field.name: getattr(game_module, field.type)(int(value)) for field, value in zip(fields, values)
+        })
+
+        yield {field.name: value for field, value in zip(fields, values)}, options
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import bisect
 import functools
-from typing import List
+import itertools
+from collections.abc import Sequence
+from typing import Any, Callable, Iterator, List, Tuple, Union
 
 from dataclasses import dataclass
 
@@ -13,6 +16,133 @@ from ..game_objective_template import GameObjectiveTemplate
 from ..enums import KeymastersKeepGamePlatforms
 
 
+class PoolView(Sequence):
+    """
+    Read-only view over one or more ranges or sequences joined end to end.
+    Indexing resolves to the owning part through the part offsets; nothing is copied or sorted.
+    """
+
+    __slots__ = ("parts", "offsets", "length")
+
+    def __init__(self, *parts: Union[range, Tuple[Any, ...]]) -> None:
+        self.parts: Tuple[Union[range, Tuple[Any, ...]], ...] = parts
+        self.offsets: List[int] = list(itertools.accumulate((len(part) for part in parts[:-1]), initial=0))
+        self.length: int = sum(len(part) for part in parts)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+
+        if index < 0:
+            index += self.length
+
+        if not 0 <= index < self.length:
+            raise IndexError("pool index out of range")
+
+        part: int = bisect.bisect_right(self.offsets, index) - 1
+        return self.parts[part][index - self.offsets[part]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return itertools.chain.from_iterable(self.parts)
+
+    def __repr__(self) -> str:
+        return f"PoolView{self.parts!r}"
+
+
+# Data Pools
+WORLDS: Tuple[str, ...] = (
+    "World 1",
+    "World 2",
+    "World 3",
+    "World 4",
+    "World 5",
+    "World 6",
+)
+
+CHALLENGES: Tuple[str, ...] = (
+    "Tutorial",
+    "Armor Tutorial",
+    "Score Tutorial",
+    "Spikes",
+    "TNT",
+    "Rockets",
+    "Rockets 2",
+    "Cannons",
+    "Lasers",
+    "Fireballs",
+    "Phantoms",
+    "Bombflys",
+    "World 1",
+    "World 2",
+    "World 3",
+    "World 4",
+    "World 5",
+    "Quad jump",
+    "Dash jump",
+    "Jetpack",
+    "Phantom puzzle",
+    "Bullet hell 1",
+    "Bullet hell 2",
+    "Mothership",
+)
+
+MATCHERS: Tuple[str, ...] = (
+    "Matcher MK1",
+    "Laser Matcher",
+    "Matcher MK2",
+    "Punch Matcher",
+    "Big Drill",
+    "Rapid Laser",
+    "Rocket Matcher",
+    "Instant Matcher",
+)
+
+SUITS: Tuple[str, ...] = (
+    "None",
+    "Glide Cape",
+    "Quad Jump Wings",
+    "Dash Jump Wings",
+    "Frog Suit",
+    "Rocket Jump",
+    "Teleporter",
+    "Jetpack",
+)
+
+KICKS: Tuple[str, ...] = (
+    "Strong Kick",
+    "Projectile Kick",
+    "Grapple Hook",
+    "Dash Kick",
+    "Lift and Throw",
+)
+
+LEVELS_BASE: Tuple[str, ...] = (
+    "Level 1",
+    "Level 2",
+    "Level 3",
+    "Level 4",
+    "Level 5",
+    "Level 6",
+)
+
+LEVELS_HARD: Tuple[str, ...] = (
+    "Level 7",
+    "Level 8",
+    "Level 9",
+)
+
+LEVELS_WITH_HARD: PoolView = PoolView(LEVELS_BASE, LEVELS_HARD)
+
+SCORES_BASE: range = range(1000, 20000, 1000)
+
+SCORES_HARD: range = range(21000, 40000, 1000)
+
+SCORES_WITH_HARD: PoolView = PoolView(SCORES_BASE, SCORES_HARD)
+
+
 @dataclass
 class UFOArchipelagoOptions:
     ufo_hard_objectives: UFOHardObjectives
@@ -34,12 +164,37 @@ class UFOGame(Game):
         return list()
 
     def game_objective_templates(self) -> List[GameObjectiveTemplate]:
-        return [
+        return list(self.objective_template_table(self.ufo_hard_objectives))
+
+    @staticmethod
+    def clear_objective_template_cache() -> None:
+        UFOGame.objective_template_table.cache_clear()
+        UFOGame.score_and_level_objective_templates.cache_clear()
+        UFOGame.challenge_objective_templates.cache_clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def objective_template_table(include_hard_objectives: bool) -> Tuple[GameObjectiveTemplate, ...]:
+        # Shared by every UFOGame with the same options; there are only two combinations.
+        # Each template group is cached on its own, so toggling the option reuses the challenge templates as-is
+        return (
+            *UFOGame.score_and_level_objective_templates(include_hard_objectives),
+            *UFOGame.challenge_objective_templates(),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def score_and_level_objective_templates(include_hard_objectives: bool) -> Tuple[GameObjectiveTemplate, ...]:
+        # Depends on ufo_hard_objectives through the score and level pools
+        scores: Callable[[], Sequence[int]] = functools.partial(UFOGame.scores_for, include_hard_objectives)
+        levels: Callable[[], Sequence[str]] = functools.partial(UFOGame.levels_for, include_hard_objectives)
+
+        return (
             GameObjectiveTemplate(
                 label="Reach SCORE score in WORLD",
                 data={
-                    "SCORE": (self.scores, 1),
-                    "WORLD": (self.worlds, 1),
+                    "SCORE": (scores, 1),
+                    "WORLD": (UFOGame.worlds, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -48,11 +203,11 @@ class UFOGame(Game):
             GameObjectiveTemplate(
                 label="Reach SCORE score in WORLD with the MATCHER matcher, SUIT suit and KICK kick",
                 data={
-                    "SCORE": (self.scores, 1),
-                    "WORLD": (self.worlds, 1),
-                    "MATCHER": (self.matchers, 1),
-                    "SUIT": (self.suits, 1),
-                    "KICK": (self.kicks, 1),
+                    "SCORE": (scores, 1),
+                    "WORLD": (UFOGame.worlds, 1),
+                    "MATCHER": (UFOGame.matchers, 1),
+                    "SUIT": (UFOGame.suits, 1),
+                    "KICK": (UFOGame.kicks, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -61,8 +216,8 @@ class UFOGame(Game):
             GameObjectiveTemplate(
                 label="Reach LEVEL in WORLD",
                 data={
-                    "LEVEL": (self.levels, 1),
-                    "WORLD": (self.worlds, 1),
+                    "LEVEL": (levels, 1),
+                    "WORLD": (UFOGame.worlds, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -71,20 +226,27 @@ class UFOGame(Game):
             GameObjectiveTemplate(
                 label="Reach LEVEL in WORLD with the MATCHER matcher, SUIT suit and KICK kick",
                 data={
-                    "LEVEL": (self.levels, 1),
-                    "WORLD": (self.worlds, 1),
-                    "MATCHER": (self.matchers, 1),
-                    "SUIT": (self.suits, 1),
-                    "KICK": (self.kicks, 1),
+                    "LEVEL": (levels, 1),
+                    "WORLD": (UFOGame.worlds, 1),
+                    "MATCHER": (UFOGame.matchers, 1),
+                    "SUIT": (UFOGame.suits, 1),
+                    "KICK": (UFOGame.kicks, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
                 weight=2,
             ),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def challenge_objective_templates() -> Tuple[GameObjectiveTemplate, ...]:
+        # Depends on no options
+        return (
             GameObjectiveTemplate(
                 label="Complete the CHALLENGE challenge",
                 data={
-                    "CHALLENGE": (self.challenges, 1),
+                    "CHALLENGE": (UFOGame.challenges, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=False,
@@ -93,13 +255,13 @@ class UFOGame(Game):
             GameObjectiveTemplate(
                 label="Complete the CHALLENGE challenge without taking damage",
                 data={
-                    "CHALLENGE": (self.challenges, 1),
+                    "CHALLENGE": (UFOGame.challenges, 1),
                 },
                 is_time_consuming=False,
                 is_difficult=True,
                 weight=2,
-            )
-        ]
+            ),
+        )
 
 
     @property
@@ -107,128 +269,49 @@ class UFOGame(Game):
         return bool(self.archipelago_options.ufo_hard_objectives.value)
         
 
-    @functools.cached_property
-    def levels_base(self) -> List[str]:
-        return [
-            "Level 1",
-            "Level 2",
-            "Level 3",
-            "Level 4",
-            "Level 5",
-            "Level 6",
-        ]
+    def levels(self) -> Sequence[str]:
+        return self.levels_for(self.ufo_hard_objectives)
 
-    @functools.cached_property
-    def hard_levels(self) -> List[str]:
-        return [
-            "Level 7",
-            "Level 8",
-            "Level 9",
-        ]
+    @staticmethod
+    def levels_for(include_hard_objectives: bool) -> Sequence[str]:
+        # Check if hard objectives are included, and include them if so
+        if include_hard_objectives:
+            return LEVELS_WITH_HARD
 
-    def levels(self) -> List[str]:
-        levels: List[str] = self.levels_base[:]
+        return LEVELS_BASE
 
-    # Check if hard objectives are included, and include them if so
-        if self.ufo_hard_objectives:
-            levels.extend(self.hard_levels)
 
-        return sorted(levels)
+    @staticmethod
+    def worlds() -> Tuple[str, ...]:
+        return WORLDS
 
 
     @staticmethod
-    def worlds() -> List[str]:
-        return [
-            "World 1",
-            "World 2",
-            "World 3",
-            "World 4",
-            "World 5",
-            "World 6",
-        ]
-
+    def challenges() -> Tuple[str, ...]:
+        return CHALLENGES
 
     @staticmethod
-    def challenges() -> List[str]:
-        return [
-            "Tutorial",
-            "Armor Tutorial",
-            "Score Tutorial",
-            "Spikes",
-            "TNT",
-            "Rockets",
-            "Rockets 2",
-            "Cannons",
-            "Lasers",
-            "Fireballs",
-            "Phantoms",
-            "Bombflys",
-            "World 1",
-            "World 2",
-            "World 3",
-            "World 4",
-            "World 5",
-            "Quad jump",
-            "Dash jump",
-            "Jetpack",
-            "Phantom puzzle",
-            "Bullet hell 1",
-            "Bullet hell 2",
-            "Mothership",
-        ]
+    def matchers() -> Tuple[str, ...]:
+        return MATCHERS
 
     @staticmethod
-    def matchers() -> List[str]:
-        return [
-            "Matcher MK1",
-            "Laser Matcher",
-            "Matcher MK2",
-            "Punch Matcher",
-            "Big Drill",
-            "Rapid Laser",
-            "Rocket Matcher",
-            "Instant Matcher",
-        ]
+    def suits() -> Tuple[str, ...]:
+        return SUITS
 
     @staticmethod
-    def suits() -> List[str]:
-        return [
-            "None",
-            "Glide Cape",
-            "Quad Jump Wings",
-            "Dash Jump Wings",
-            "Frog Suit",
-            "Rocket Jump",
-            "Teleporter",
-            "Jetpack",
-        ]
+    def kicks() -> Tuple[str, ...]:
+        return KICKS
+
+    def scores(self) -> Sequence[int]:
+        return self.scores_for(self.ufo_hard_objectives)
 
     @staticmethod
-    def kicks() -> List[str]:
-        return [
-            "Strong Kick",
-            "Projectile Kick",
-            "Grapple Hook",
-            "Dash Kick",
-            "Lift and Throw",
-        ]
-
-    @functools.cached_property
-    def scores_base(self) -> range:
-        return list(range(1000, 20000, 1000))
-
-    @functools.cached_property
-    def scores_hard(self) -> range:
-        return list(range(21000, 40000, 1000))
-
-    def scores(self) -> List[str]:
-        scores: List[str] = self.scores_base[:]
-
-    # Check if hard objectives are included, and include them if so
-        if self.ufo_hard_objectives:
-            scores.extend(self.scores_hard)
-
-        return sorted(scores)
+    def scores_for(include_hard_objectives: bool) -> Sequence[int]:
+        # Check if hard objectives are included, and include them if so
+        if include_hard_objectives:
+            return SCORES_WITH_HARD
+
+        return SCORES_BASE
 
 # Archipelago Options
 class UFOHardObjectives(Toggle):